@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
-import json
+import asyncio
+import atexit
+import heapq
+import itertools
 import logging
 import os
 import signal
@@ -8,12 +11,19 @@ import sys
 import threading
 import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Optional
 
 from local_file_picker import local_file_picker
-from nicegui import ui
+from nicegui import app, ui
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging for service mode
 logging.basicConfig(
@@ -35,6 +45,196 @@ else:
 
 TASKS_FILE = app_dir / 'sync_tasks.json'
 
+# Sorts before every real st_mtime_ns, so files missing at the destination always compare as older
+_MISSING_MTIME = -2 ** 63
+
+
+def _read_json(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+def _write_json(path, obj, indent=False):
+    """Serialize obj to path, writing beside it and swapping it in so a crash never leaves it half-written."""
+    if orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        import json
+        data = json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+    
+    # Ensure the directory exists
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+
+
+def _fastcopy(src, dst):
+    """Copy src to dst with its metadata; shutil.copyfile already uses sendfile on Linux and fcopyfile on macOS."""
+    if os.name == 'nt':
+        import ctypes
+        hr = ctypes.windll.kernel32.CopyFile2(str(src), str(dst), None)
+        if hr != 0:
+            # The userspace copy raises a proper error if the file really cannot be copied
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+    
+    class _WIN32_FIND_DATAW(ctypes.Structure):
+        _fields_ = [
+            ('dwFileAttributes', wintypes.DWORD),
+            ('ftCreationTime', wintypes.FILETIME),
+            ('ftLastAccessTime', wintypes.FILETIME),
+            ('ftLastWriteTime', wintypes.FILETIME),
+            ('nFileSizeHigh', wintypes.DWORD),
+            ('nFileSizeLow', wintypes.DWORD),
+            ('dwReserved0', wintypes.DWORD),
+            ('dwReserved1', wintypes.DWORD),
+            ('cFileName', wintypes.WCHAR * 260),
+            ('cAlternateFileName', wintypes.WCHAR * 14),
+        ]
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.FindFirstFileExW.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(_WIN32_FIND_DATAW),
+        ctypes.c_int, wintypes.LPVOID, wintypes.DWORD,
+    ]
+    _kernel32.FindFirstFileExW.restype = wintypes.HANDLE
+    _kernel32.FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_WIN32_FIND_DATAW)]
+    _kernel32.FindNextFileW.restype = wintypes.BOOL
+    _kernel32.FindClose.argtypes = [wintypes.HANDLE]
+    _kernel32.FindClose.restype = wintypes.BOOL
+    
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    _FIND_EX_INFO_BASIC = 1
+    _FIND_EX_SEARCH_NAME_MATCH = 0
+    _FIND_FIRST_EX_LARGE_FETCH = 2
+    _ERROR_FILE_NOT_FOUND = 2
+    _ERROR_NO_MORE_FILES = 18
+    _FILE_ATTRIBUTE_DIRECTORY = 0x10
+    _FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+    _EPOCH_AS_FILETIME = 116444736000000000
+
+
+def _scan_windows(path):
+    """Yield (name, is_dir, size, st_mtime_ns) for each entry in path from a single FindFirstFileExW enumeration."""
+    data = _WIN32_FIND_DATAW()
+    handle = _kernel32.FindFirstFileExW(
+        os.path.join(path, '*'), _FIND_EX_INFO_BASIC, ctypes.byref(data),
+        _FIND_EX_SEARCH_NAME_MATCH, None, _FIND_FIRST_EX_LARGE_FETCH,
+    )
+    if handle == _INVALID_HANDLE_VALUE:
+        error = ctypes.get_last_error()
+        if error == _ERROR_FILE_NOT_FOUND:
+            return
+        raise ctypes.WinError(error)
+    
+    try:
+        while True:
+            name = data.cFileName
+            if name not in ('.', '..'):
+                attributes = data.dwFileAttributes
+                if attributes & _FILE_ATTRIBUTE_REPARSE_POINT:
+                    # Links are followed for files and never descended into as directories
+                    if not attributes & _FILE_ATTRIBUTE_DIRECTORY:
+                        try:
+                            st = os.stat(os.path.join(path, name))
+                        except OSError:
+                            yield name, False, None, None
+                        else:
+                            yield name, False, st.st_size, st.st_mtime_ns
+                elif attributes & _FILE_ATTRIBUTE_DIRECTORY:
+                    yield name, True, 0, 0
+                else:
+                    write_time = data.ftLastWriteTime
+                    ticks = (write_time.dwHighDateTime << 32) | write_time.dwLowDateTime
+                    size = (data.nFileSizeHigh << 32) | data.nFileSizeLow
+                    yield name, False, size, (ticks - _EPOCH_AS_FILETIME) * 100
+            
+            if not _kernel32.FindNextFileW(handle, ctypes.byref(data)):
+                error = ctypes.get_last_error()
+                if error == _ERROR_NO_MORE_FILES:
+                    return
+                raise ctypes.WinError(error)
+    finally:
+        _kernel32.FindClose(handle)
+
+
+def _scan_dir(path):
+    """Yield (name, is_dir, size, st_mtime_ns) for each entry in path; size and mtime are None if a file could not be stat'ed."""
+    if os.name == 'nt':
+        yield from _scan_windows(path)
+        return
+    
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry.name, True, 0, 0
+                elif entry.is_file():
+                    st = entry.stat()
+                    yield entry.name, False, st.st_size, st.st_mtime_ns
+            except OSError:
+                yield entry.name, False, None, None
+
+
+def _scan_files(path):
+    """Recursively yield (path, st_mtime_ns) for the files below path, passing through unstat'able files as None."""
+    try:
+        entries = list(_scan_dir(path))
+    except OSError:
+        return
+    
+    for name, is_dir, _size, mtime in entries:
+        entry_path = os.path.join(path, name)
+        if is_dir:
+            yield from _scan_files(entry_path)
+        else:
+            yield entry_path, mtime
+
+
+def _dest_mtimes(dest_dir):
+    """Return {name: st_mtime_ns} for the files in dest_dir, or {} if it does not exist yet."""
+    try:
+        return {name: mtime for name, is_dir, _size, mtime in _scan_dir(dest_dir) if not is_dir and mtime is not None}
+    except FileNotFoundError:
+        return {}
+
+
+def _parse_schedule(task):
+    """Cache the parsed scheduled_datetime on the task so the scheduler never re-parses it."""
+    task['_scheduled_dt'] = datetime.fromisoformat(task['scheduled_datetime'])
+    task['_scheduled_time'] = task['_scheduled_dt'].time()
+
+
+def _copy_workers(dest):
+    """Size the copy pool for dest: network shares benefit from many requests in flight, local disks do not."""
+    if dest.startswith(('\\\\', '//')):
+        return min(32, (os.cpu_count() or 1) * 4)
+    return 4
+
+
+class _SyncResult:
+    """Counters for one sync run; the count objects and deque are safe to advance from copy workers."""
+    
+    def __init__(self):
+        self.copied = itertools.count()
+        self.errors = itertools.count()
+        self.error_files = deque()
+        # Only advanced on the thread running the sync
+        self.skipped = 0
+
 
 class TaskManager:
     _instance = None
@@ -43,32 +243,54 @@ class TaskManager:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.active_tasks = set()
+            cls._instance._tasks = None
+            cls._instance._tasks_lock = threading.RLock()
+            cls._instance._dirty_event = threading.Event()
+            cls._instance._schedule_heap = []
+            cls._instance._scheduled = {}
+            cls._instance._schedule_lock = threading.Lock()
+            cls._instance._loop = None
+            cls._instance._wake = None
+            cls._instance._scheduler_task = None
+            cls._instance._firing = set()
+            cls._instance._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='sync')
             cls._instance._initialized = False
         return cls._instance
     
     def __init__(self):
         if not self._initialized:
+            self.load_tasks()
+            threading.Thread(target=self._flusher, daemon=True).start()
+            atexit.register(self._flush_now)
+            app.on_startup(self.start)
+            app.on_shutdown(self.stop)
             self.load_and_start_tasks()
             self._initialized = True
     
     def load_tasks(self):
+        with self._tasks_lock:
+            if self._tasks is None:
+                self._tasks = self._read_tasks()
+            return list(self._tasks)
+    
+    def _read_tasks(self):
         if not TASKS_FILE.exists():
             return []
         
         try:
-            with open(TASKS_FILE, 'r', encoding='utf-8') as f:
-                tasks = json.load(f)
-            
-            # Migrate old tasks
-            for task in tasks:
-                if 'id' not in task:
-                    task['id'] = str(uuid.uuid4())
-                if 'is_template' not in task:
-                    task['is_template'] = False
-                if 'last_ran' not in task:
-                    task['last_ran'] = None
+            tasks = _read_json(TASKS_FILE)
             
-            self.save_tasks(tasks)
+            # Migrate old tasks, rewriting the file only if something changed
+            if any('id' not in t or 'is_template' not in t or 'last_ran' not in t for t in tasks):
+                for task in tasks:
+                    if 'id' not in task:
+                        task['id'] = str(uuid.uuid4())
+                    if 'is_template' not in task:
+                        task['is_template'] = False
+                    if 'last_ran' not in task:
+                        task['last_ran'] = None
+                
+                self.save_tasks(tasks)
             return tasks
         except Exception as e:
             logging.error(f"Error loading tasks: {e}")
@@ -76,154 +298,288 @@ class TaskManager:
     
     def save_tasks(self, tasks):
         try:
-            # Ensure the directory exists
-            TASKS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(TASKS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(tasks, f, indent=2)
+            # Underscore keys hold parsed values cached at runtime and are not persisted
+            tasks = [{k: v for k, v in t.items() if not k.startswith('_')} for t in tasks]
+            _write_json(TASKS_FILE, tasks, indent=True)
         except Exception as e:
             logging.error(f"Error saving tasks: {e}")
     
+    def _flusher(self):
+        while True:
+            self._dirty_event.wait()
+            # Coalesce bursts of mutations into a single write
+            time.sleep(0.5)
+            self._flush_now()
+    
+    def _flush_now(self):
+        with self._tasks_lock:
+            if not self._dirty_event.is_set():
+                return
+            self._dirty_event.clear()
+            self.save_tasks(self._tasks)
+    
     def add_task(self, task_data):
-        tasks = self.load_tasks()
-        tasks.append(task_data)
-        self.save_tasks(tasks)
+        with self._tasks_lock:
+            self._tasks.append(task_data)
+        self._dirty_event.set()
     
     def remove_task(self, task_id):
-        tasks = self.load_tasks()
-        tasks = [t for t in tasks if t.get('id') != task_id]
-        self.save_tasks(tasks)
-        self.active_tasks.discard(task_id)
+        with self._tasks_lock:
+            self._tasks = [t for t in self._tasks if t.get('id') != task_id]
+        self._dirty_event.set()
+        with self._schedule_lock:
+            self.active_tasks.discard(task_id)
+            self._scheduled.pop(task_id, None)
     
     def update_task(self, task_id, updates):
-        tasks = self.load_tasks()
-        for task in tasks:
-            if task.get('id') == task_id:
-                task.update(updates)
-                break
-        self.save_tasks(tasks)
+        with self._tasks_lock:
+            for task in self._tasks:
+                if task.get('id') == task_id:
+                    task.update(updates)
+                    if 'scheduled_datetime' in updates:
+                        _parse_schedule(task)
+                    break
+        self._dirty_event.set()
+    
+    def _update_task_fast(self, task, updates):
+        """Update a task record the caller already holds, skipping the search by id."""
+        with self._tasks_lock:
+            task.update(updates)
+            if 'scheduled_datetime' in updates:
+                _parse_schedule(task)
+        self._dirty_event.set()
     
     def sync_files(self, source_path, dest_path):
         try:
-            source = Path(source_path)
-            dest = Path(dest_path)
+            source = os.path.normpath(source_path)
+            dest = os.path.normpath(dest_path)
+            name = os.path.basename(source)
             
             logging.info(f"Starting sync: {source} -> {dest}")
             
-            # Reset counters
-            self.copied_count = 0
-            self.skipped_count = 0
-            self.error_count = 0
-            self.error_files = []
-            
-            if source.is_file():
-                self._sync_file(source, dest / source.name)
+            result = _SyncResult()
+            if os.path.isfile(source):
+                self._sync_file(source, os.path.join(dest, name), result)
             else:
-                self._sync_directory(source, dest / source.name)
+                self._sync_directory(source, os.path.join(dest, name), result)
             
-            logging.info(f"Sync completed - Copied: {self.copied_count}, Identical: {self.skipped_count}, Errors: {self.error_count}")
+            copied = next(result.copied)
+            skipped = result.skipped
+            errors = next(result.errors)
+            logging.info(f"Sync completed - Copied: {copied}, Identical: {skipped}, Errors: {errors}")
             
-            if self.error_files:
+            if result.error_files:
                 logging.warning("Files with errors:")
-                for error_file in self.error_files:
+                for error_file in result.error_files:
                     logging.warning(f"  - {error_file}")
         except Exception as e:
             logging.error(f"Sync failed: {e}")
     
-    def _sync_file(self, source: Path, dest: Path):
+    def _sync_file(self, source: str, dest: str, result: _SyncResult):
         try:
-            if not dest.exists() or source.stat().st_mtime > dest.stat().st_mtime:
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, dest)
-                self.copied_count += 1
+            try:
+                source_stat = os.stat(source)
+                dest_stat = os.stat(dest)
+                copy = source_stat.st_mtime_ns > dest_stat.st_mtime_ns
+            except FileNotFoundError:
+                copy = True
+            
+            if copy:
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                _fastcopy(source, dest)
+                next(result.copied)
             else:
-                self.skipped_count += 1
+                result.skipped += 1
         except PermissionError:
-            self.error_count += 1
-            self.error_files.append(f"{source.name} (Access denied)")
+            next(result.errors)
+            result.error_files.append(f"{os.path.basename(source)} (Access denied)")
         except Exception as e:
-            self.error_count += 1
-            self.error_files.append(f"{source.name} ({e})")
+            next(result.errors)
+            result.error_files.append(f"{os.path.basename(source)} ({e})")
     
-    def _sync_directory(self, source: Path, dest: Path):
-        dest.mkdir(parents=True, exist_ok=True)
+    def _sync_directory(self, source: str, dest: str, result: _SyncResult):
+        os.makedirs(dest, exist_ok=True)
+        prefix_len = len(os.path.join(source, ''))
+        # Each destination directory is enumerated once per run, on first use
+        dir_mtimes = {}
+        # Parent directories already ensured this run, so each gets one makedirs instead of one per file
+        created_dirs = {dest}
         
-        for item in source.rglob('*'):
-            if item.is_file():
-                try:
-                    relative_path = item.relative_to(source)
-                    dest_file = dest / relative_path
-                    
-                    if not dest_file.exists() or item.stat().st_mtime > dest_file.stat().st_mtime:
-                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(item, dest_file)
-                        self.copied_count += 1
-                    else:
-                        self.skipped_count += 1
-                except PermissionError:
-                    self.error_count += 1
-                    self.error_files.append(f"{item.relative_to(source)} (Access denied)")
-                except Exception as e:
-                    self.error_count += 1
-                    self.error_files.append(f"{item.relative_to(source)} ({e})")
+        # Bind everything the per-file loops touch to locals; attribute lookups dominate on large trees
+        sep = os.sep
+        split = os.path.split
+        dirname = os.path.dirname
+        makedirs = os.makedirs
+        fastcopy = _fastcopy
+        dest_mtimes_for = _dest_mtimes
+        copied = result.copied
+        errors = result.errors
+        error_files = result.error_files
+        
+        skipped = 0
+        copies = []
+        add_copy = copies.append
+        for source_file, source_mtime in _scan_files(source):
+            relative_path = source_file[prefix_len:]
+            try:
+                if source_mtime is None:
+                    # The scan could not stat this file; stat it again so the error is recorded
+                    source_mtime = os.stat(source_file).st_mtime_ns
+                
+                dest_file = dest + sep + relative_path
+                dest_dir, name = split(dest_file)
+                
+                mtimes = dir_mtimes.get(dest_dir)
+                if mtimes is None:
+                    mtimes = dir_mtimes[dest_dir] = dest_mtimes_for(dest_dir)
+                
+                if source_mtime > mtimes.get(name, _MISSING_MTIME):
+                    add_copy((source_file, dest_file, relative_path))
+                else:
+                    skipped += 1
+            except PermissionError:
+                next(errors)
+                error_files.append(f"{relative_path} (Access denied)")
+            except Exception as e:
+                next(errors)
+                error_files.append(f"{relative_path} ({e})")
+        
+        result.skipped += skipped
+        
+        def copy_one(item):
+            source_file, dest_file, relative_path = item
+            try:
+                parent = dirname(dest_file)
+                if parent not in created_dirs:
+                    makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                fastcopy(source_file, dest_file)
+                next(copied)
+            except PermissionError:
+                next(errors)
+                error_files.append(f"{relative_path} (Access denied)")
+            except Exception as e:
+                next(errors)
+                error_files.append(f"{relative_path} ({e})")
+        
+        if copies:
+            with ThreadPoolExecutor(max_workers=_copy_workers(dest)) as pool:
+                pool.map(copy_one, copies)
     
     def run_task(self, task):
         task_id = task.get('id')
         
-        if task_id in self.active_tasks:
-            return
+        with self._schedule_lock:
+            if task_id in self.active_tasks:
+                return
+            self.active_tasks.add(task_id)
+            self._scheduled[task_id] = task
         
-        self.active_tasks.add(task_id)
+        if '_scheduled_dt' not in task:
+            _parse_schedule(task)
         
+        now = datetime.now()
         if task.get('is_repeat'):
-            self._run_repeat_task(task)
-        else:
-            self._run_one_time_task(task)
-    
-    def _run_repeat_task(self, task):
-        task_id = task['id']
-        scheduled_time = datetime.fromisoformat(task['scheduled_datetime']).time()
-        
-        while True:
-            now = datetime.now()
-            today = now.date()
-            next_run = datetime.combine(today, scheduled_time)
-            
+            scheduled_time = task['_scheduled_time']
+            next_run = datetime.combine(now.date(), scheduled_time)
             if next_run <= now:
-                next_run = datetime.combine(today + timedelta(days=1), scheduled_time)
+                next_run = datetime.combine(now.date() + timedelta(days=1), scheduled_time)
             
             wait_seconds = (next_run - now).total_seconds()
             logging.info(f"Next sync in {int(wait_seconds)}s at {next_run.strftime('%Y-%m-%d %H:%M')}")
+        else:
+            next_run = task['_scheduled_dt']
+            if next_run > now:
+                wait_seconds = (next_run - now).total_seconds()
+                logging.info(f"Waiting {int(wait_seconds)}s for scheduled sync")
+        
+        self._schedule(task_id, next_run)
+    
+    def _schedule(self, task_id, run_at):
+        with self._schedule_lock:
+            heapq.heappush(self._schedule_heap, (run_at.timestamp(), task_id))
+        # Before startup the scheduler picks the heap up when it first runs
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+    
+    def start(self):
+        """Run the scheduler on NiceGUI's event loop; registered as an app startup handler."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._scheduler_task = self._loop.create_task(self._scheduler_loop())
+    
+    def stop(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._flush_now()
+    
+    def run_now(self, source_path, dest_path):
+        """Start a sync on the I/O pool without blocking the event loop."""
+        return self._loop.run_in_executor(self._io_pool, self.sync_files, source_path, dest_path)
+    
+    async def _scheduler_loop(self):
+        while True:
+            self._wake.clear()
+            with self._schedule_lock:
+                deadline = self._schedule_heap[0][0] if self._schedule_heap else None
             
-            time.sleep(wait_seconds)
-            logging.info(f"Running repeat sync: {task['source_path']}")
+            if deadline is None:
+                await self._wake.wait()
+                continue
             
-            self.sync_files(task['source_path'], task['destination_path'])
+            wait_seconds = deadline - time.time()
+            if wait_seconds > 0:
+                # Woken early whenever a new deadline is pushed
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
             
-            # Update last_ran and next scheduled_datetime
-            next_scheduled = next_run + timedelta(days=1)
-            self.update_task(task_id, {
-                'last_ran': datetime.now().isoformat(),
-                'scheduled_datetime': next_scheduled.isoformat()
-            })
-    
-    def _run_one_time_task(self, task):
-        scheduled_datetime = datetime.fromisoformat(task['scheduled_datetime'])
-        now = datetime.now()
-        
-        if scheduled_datetime > now:
-            wait_seconds = (scheduled_datetime - now).total_seconds()
-            logging.info(f"Waiting {int(wait_seconds)}s for scheduled sync")
-            time.sleep(wait_seconds)
-        
-        logging.info(f"Running scheduled sync: {task['source_path']}")
-        self.sync_files(task['source_path'], task['destination_path'])
-        
-        self.update_task(task['id'], {'last_ran': datetime.now().isoformat()})
-        self.remove_task(task['id'])
+            with self._schedule_lock:
+                run_at, task_id = heapq.heappop(self._schedule_heap)
+                task = self._scheduled.get(task_id)
+            
+            if task is not None:
+                fired = asyncio.create_task(self._fire_task(task))
+                self._firing.add(fired)
+                fired.add_done_callback(self._firing.discard)
+    
+    async def _fire_task(self, task):
+        try:
+            if task.get('is_repeat'):
+                logging.info(f"Running repeat sync: {task['source_path']}")
+                await self.run_now(task['source_path'], task['destination_path'])
+                
+                # Next occurrence after now, so a late or missed run fires once rather than catching up day by day
+                now = datetime.now()
+                today = now.date()
+                next_run = datetime.combine(today, task['_scheduled_time'])
+                
+                if next_run <= now:
+                    next_run = datetime.combine(today + timedelta(days=1), task['_scheduled_time'])
+                
+                # Update last_ran and next scheduled_datetime
+                self._update_task_fast(task, {
+                    'last_ran': now.isoformat(),
+                    'scheduled_datetime': next_run.isoformat()
+                })
+                
+                wait_seconds = (next_run - now).total_seconds()
+                logging.info(f"Next sync in {int(wait_seconds)}s at {next_run.strftime('%Y-%m-%d %H:%M')}")
+                self._schedule(task['id'], next_run)
+            else:
+                logging.info(f"Running scheduled sync: {task['source_path']}")
+                await self.run_now(task['source_path'], task['destination_path'])
+                
+                self._update_task_fast(task, {'last_ran': datetime.now().isoformat()})
+                self.remove_task(task['id'])
+        except Exception as e:
+            logging.error(f"Scheduled sync failed: {e}")
     
     def load_and_start_tasks(self):
         tasks = self.load_tasks()
-        
         for task in tasks:
             if task.get('is_template'):
                 continue
@@ -232,9 +588,17 @@ class TaskManager:
             if task_id in self.active_tasks:
                 continue
             
+            # Parsed here rather than at load so one bad entry cannot fail the whole file
+            if '_scheduled_dt' not in task:
+                try:
+                    _parse_schedule(task)
+                except (KeyError, TypeError, ValueError) as e:
+                    logging.error(f"Skipping task {task_id} with invalid schedule: {e}")
+                    continue
+            
             if task.get('is_repeat'):
                 # Update repeat task to next valid time
-                original_time = datetime.fromisoformat(task['scheduled_datetime']).time()
+                original_time = task['_scheduled_time']
                 today = date.today()
                 next_run = datetime.combine(today, original_time)
                 
@@ -242,11 +606,10 @@ class TaskManager:
                     next_run = datetime.combine(today + timedelta(days=1), original_time)
                 
                 self.update_task(task_id, {'scheduled_datetime': next_run.isoformat()})
-                task['scheduled_datetime'] = next_run.isoformat()
                 
                 logging.info(f"Scheduling repeat task: {task['source_path']} at {next_run.strftime('%Y-%m-%d %H:%M')}")
             else:
-                scheduled_datetime = datetime.fromisoformat(task['scheduled_datetime'])
+                scheduled_datetime = task['_scheduled_dt']
                 if scheduled_datetime <= datetime.now():
                     logging.info(f"Removing old task: {task['source_path']}")
                     self.remove_task(task_id)
@@ -254,8 +617,15 @@ class TaskManager:
                 
                 logging.info(f"Scheduling task: {task['source_path']} at {scheduled_datetime.strftime('%Y-%m-%d %H:%M')}")
             
-            thread = threading.Thread(target=self.run_task, args=(task,), daemon=True)
-            thread.start()
+            self.run_task(task)
+
+
+# Schedule picker options, shared by every dialog
+_YEARS = [2024, 2025, 2026]
+_MONTHS = list(range(1, 13))
+_DAYS = list(range(1, 32))
+_HOURS = list(range(24))
+_MINUTES = list(range(60))
 
 
 class SyncDialog(ui.dialog):
@@ -264,6 +634,7 @@ class SyncDialog(ui.dialog):
         self.task_manager = TaskManager()
         self.source_path = None
         self.destination_path = None
+        now = datetime.now()
         
         with self:
             with ui.card():
@@ -287,13 +658,13 @@ class SyncDialog(ui.dialog):
                 # Schedule options
                 with ui.column() as self.schedule_row:
                     with ui.row():
-                        self.year_select = ui.select([2024, 2025, 2026], value=datetime.now().year).props('dense')
-                        self.month_select = ui.select(list(range(1, 13)), value=datetime.now().month).props('dense')
-                        self.day_select = ui.select(list(range(1, 32)), value=datetime.now().day).props('dense')
+                        self.year_select = ui.select(_YEARS, value=now.year).props('dense')
+                        self.month_select = ui.select(_MONTHS, value=now.month).props('dense')
+                        self.day_select = ui.select(_DAYS, value=now.day).props('dense')
                     
                     with ui.row():
-                        self.hour_select = ui.select(list(range(24)), value=datetime.now().hour).props('dense')
-                        self.minute_select = ui.select(list(range(60)), value=datetime.now().minute).props('dense')
+                        self.hour_select = ui.select(_HOURS, value=now.hour).props('dense')
+                        self.minute_select = ui.select(_MINUTES, value=now.minute).props('dense')
                     
                     self.repeat_checkbox = ui.checkbox('Repeat daily')
                 
@@ -337,11 +708,7 @@ class SyncDialog(ui.dialog):
         
         if self.run_mode.value == 'Run Now':
             ui.notify('Sync started')
-            threading.Thread(
-                target=self.task_manager.sync_files,
-                args=(self.source_path, self.destination_path),
-                daemon=True
-            ).start()
+            self.task_manager.run_now(self.source_path, self.destination_path)
             
             if self.save_task_checkbox.value:
                 self._save_template()
@@ -398,7 +765,7 @@ class SyncDialog(ui.dialog):
         else:
             ui.notify(f'Sync scheduled for {scheduled_datetime.strftime("%m/%d %H:%M")}')
         
-        threading.Thread(target=self.task_manager.run_task, args=(task_data,), daemon=True).start()
+        self.task_manager.run_task(task_data)
 
 
 async def open_sync_dialog():
@@ -413,6 +780,7 @@ def index():
 # Signal handler for graceful shutdown
 def signal_handler(signum, frame):
     logging.info("Received shutdown signal, stopping gracefully...")
+    TaskManager()._flush_now()
     sys.exit(0)
 
 # Register signal handlers